@@ -44,6 +44,7 @@
 #include "py/objarray.h"
 #include "py/stream.h"
 #include "py/binary.h"
+#include "py/smallint.h"
 
 #include "mpconfigport.h"
 #include "mphalport.h"
@@ -376,7 +377,7 @@ static mp_map_elem_t *_update_rssi(
         list = MP_OBJ_TO_PTR(item->value);
     }
     list->items[0] = MP_OBJ_NEW_SMALL_INT(rssi);
-    list->items[1] = mp_obj_new_int(time_ms);
+    list->items[1] = MP_OBJ_NEW_SMALL_INT(time_ms);
     return item;
 }
 #endif // MICROPY_ESPNOW_RSSI
@@ -473,7 +474,7 @@ STATIC mp_obj_t espnow_recvinto(size_t n_args, const mp_obj_t *args) {
     list->items[0] = _update_rssi(peer_buf, hdr.rssi, hdr.time_ms)->key;
     if (list->len >= 4) {
         list->items[2] = MP_OBJ_NEW_SMALL_INT(hdr.rssi);
-        list->items[3] = mp_obj_new_int(hdr.time_ms);
+        list->items[3] = MP_OBJ_NEW_SMALL_INT(hdr.time_ms);
     }
     #endif // MICROPY_ESPNOW_RSSI
 
@@ -593,7 +594,9 @@ STATIC void recv_cb(
     header.msg_len = msg_len;
     #if MICROPY_ESPNOW_RSSI
     header.rssi = _get_rssi_from_wifi_pkt(msg);
-    header.time_ms = mp_hal_ticks_ms();
+    // Wrap like time.ticks_ms() so the value is always a small int and
+    // reading it back never allocates memory.
+    header.time_ms = mp_hal_ticks_ms() & (MICROPY_PY_UTIME_TICKS_PERIOD - 1);
     #endif // MICROPY_ESPNOW_RSSI
 
     buffer_put(buf, &header, sizeof(header));
@@ -29,8 +29,9 @@ class AIOESPNow(espnow.ESPNow):
     def __aiter__(self):
         return self
 
-    async def __anext__(self):
-        return await self.airecv()
+    async def __anext__(self):  # Inline airecv() to save a coroutine per msg
+        yield uasyncio.core._io_queue.queue_read(self)
+        return self.irecv(0)
 
 
 # Convenience function to support:
@@ -2,26 +2,36 @@
 # MIT license; Copyright (c) 2022 Glenn Moloney @glenn20
 
 from micropython import const
-from _espnow import *
+from _espnow import (
+    ESPNow,
+    MAX_DATA_LEN,
+    ETH_ALEN,
+    KEY_LEN,
+    MAX_TOTAL_PEER_NUM,
+    MAX_ENCRYPT_PEER_NUM,
+)
 
 EVENT_RECV_MSG = const(1)
 
+# Returned by irecv() and recv() on timeout
+_NONE_TUPLE = (None, None)
+
 
 class ESPNow(ESPNow):
     # Static buffers for alloc free receipt of messages with ESPNow.irecv().
     _data = [None, bytearray(MAX_DATA_LEN)]
-    _none_tuple = (None, None)
 
     def __init__(self):
         super().__init__()
+        self._recvinto = self.recvinto  # Cache bound method for __next__()
 
     def irecv(self, timeout=None):
         n = self.recvinto(self._data, timeout)
-        return self._data if n else self._none_tuple
+        return self._data if n else _NONE_TUPLE
 
     def recv(self, timeout=None):
         n = self.recvinto(self._data, timeout)
-        return [bytes(x) for x in self._data] if n else self._none_tuple
+        return (bytes(self._data[0]), bytes(self._data[1])) if n else _NONE_TUPLE
 
     def on_recv(self, recv_cb, arg=None):
         super().on_recv(recv_cb, self if arg is None else arg)
@@ -36,7 +46,8 @@ class ESPNow(ESPNow):
         return self
 
     def __next__(self):
-        return self.irecv()  # Use alloc free irecv() method
+        n = self._recvinto(self._data, None)  # Alloc free, like irecv()
+        return self._data if n else _NONE_TUPLE
 
     # Backward compatibility with pre-release API
     def init(self):
@@ -1,33 +1,44 @@
 # espnow module for MicroPython on ESP8266
 # MIT license; Copyright (c) 2022 Glenn Moloney @glenn20
 
-from _espnow import *
+from _espnow import (
+    ESPNow,
+    MAX_DATA_LEN,
+    ETH_ALEN,
+    KEY_LEN,
+    MAX_TOTAL_PEER_NUM,
+    MAX_ENCRYPT_PEER_NUM,
+)
 from uselect import poll, POLLIN
 
+# Returned by irecv() and recv() on timeout
+_NONE_TUPLE = (None, None)
+
 
 class ESPNow(ESPNow):
     # Static buffers for alloc free receipt of messages with ESPNow.irecv().
     _data = [bytearray(ETH_ALEN), bytearray(MAX_DATA_LEN)]
-    _none_tuple = (None, None)
 
     def __init__(self):
         super().__init__()
         self._poll = poll()  # For any() method below...
         self._poll.register(self, POLLIN)
+        self._recvinto = self.recvinto  # Cache bound method for __next__()
 
     def irecv(self, timeout=None):
         n = self.recvinto(self._data, timeout)
-        return self._data if n else self._none_tuple
+        return self._data if n else _NONE_TUPLE
 
     def recv(self, timeout=None):
         n = self.recvinto(self._data, timeout)
-        return [bytes(x) for x in self._data] if n else self._none_tuple
+        return (bytes(self._data[0]), bytes(self._data[1])) if n else _NONE_TUPLE
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return self.irecv()  # Use alloc free irecv() method
+        n = self._recvinto(self._data, None)  # Alloc free, like irecv()
+        return self._data if n else _NONE_TUPLE
 
     def any(self):  # For the ESP8266 which does not have ESPNow.any()
         try:
@@ -4,7 +4,7 @@
 
 try:
     import network
-    import random
+    import uos
     import usys
     import espnow
 except ImportError:
@@ -18,17 +18,19 @@ sync = True
 
 
 def echo_server(e):
-    peers = []
+    irecv, send, add_peer = e.irecv, e.send, e.add_peer  # Hoist method lookups
+    peers = set()
     while True:
-        peer, msg = e.irecv(timeout)
+        peer, msg = irecv(timeout)
         if peer is None:
             return
+        peer = bytes(peer)  # esp8266 irecv() returns peer in a reused bytearray
         if peer not in peers:
-            peers.append(peer)
-            e.add_peer(peer)
+            peers.add(peer)
+            add_peer(peer)
 
         #  Echo the MAC and message back to the sender
-        if not e.send(peer, msg, sync):
+        if not send(peer, msg, sync):
             print("ERROR: send() failed to", peer)
             return
 
@@ -36,43 +38,35 @@ def echo_server(e):
             return
 
 
+# Return the test report line so callers can print several at once
 def client_send(e, peer, msg, sync):
-    print("TEST: send/recv(msglen=", len(msg), ",sync=", sync, "): ", end="", sep="")
+    report = "TEST: send/recv(msglen={},sync={}): ".format(len(msg), sync)
     try:
         if not e.send(peer, msg, sync):
-            print("ERROR: Send failed.")
-            return
+            return report + "ERROR: Send failed."
     except OSError as exc:
         # Don't print exc as it is differs for esp32 and esp8266
-        print("ERROR: OSError:")
-        return
-    print("OK")
+        return report + "ERROR: OSError:"
+    return report + "OK"
 
 
 def init(sta_active=True, ap_active=False):
-    wlans = [network.WLAN(i) for i in [network.STA_IF, network.AP_IF]]
+    sta = network.WLAN(network.STA_IF)
+    ap = network.WLAN(network.AP_IF)
     e = espnow.ESPNow()
     e.active(True)
     e.set_pmk(default_pmk)
-    wlans[0].active(sta_active)
-    wlans[1].active(ap_active)
-    wlans[0].disconnect()  # Force esp8266 STA interface to disconnect from AP
-    return e
-
-
-def poll(e):
-    poll = uselect.poll()
-    poll.register(e, uselect.POLLIN)
-    p = poll.ipoll(timeout)
-    if not p:
-        print("ERROR: poll() timeout waiting for response.")
-    return p
+    sta.active(sta_active)
+    ap.active(ap_active)
+    if usys.platform != "esp32":
+        sta.disconnect()  # Force esp8266 STA interface to disconnect from AP
+    return e, sta, ap
 
 
 # Server
 def instance0():
-    e = init(True, False)
-    multitest.globals(PEERS=[network.WLAN(i).config("mac") for i in (0, 1)])
+    e, sta, ap = init(True, False)
+    multitest.globals(PEERS=[sta.config("mac"), ap.config("mac")])
     multitest.next()
     print("Server Start")
     echo_server(e)
@@ -86,31 +80,54 @@ def instance1():
 
 try:
     import uasyncio as asyncio
+except ImportError:
+    asyncio = None
+
+if asyncio is not None:
 
     async def client():
         from aioespnow import AIOESPNow
 
-        e = AIOESPNow(init(True, False))
-        e.config(timeout=timeout)
+        init(True, False)
+        e = AIOESPNow()
         peer = PEERS[0]
         e.add_peer(peer)
         multitest.next()
 
         print("airecv() test...")
-        msgs = []
-        for i in range(5):
-            # Send messages to the peer who will echo it back
-            msgs.append(bytes([random.getrandbits(8) for _ in range(12)]))
-            client_send(e, peer, msgs[i], True)
-
-        for i in range(5):
-            mac, reply = await e.airecv()
-            print("OK" if reply == msgs[i] else "ERROR: Received != Sent")
+        # Send messages to the peer who will echo them back.
+        # The payloads are views into a single buffer of random bytes.
+        pool = memoryview(uos.urandom(12 * 5))
+        msgs = tuple(pool[i * 12 : (i + 1) * 12] for i in range(5))
+
+        async def send_one(msg):
+            await asyncio.sleep_ms(0)  # Let verifier() read any echoes
+            return client_send(e, peer, msg, False)
+
+        async def sender():
+            # Queue the whole burst without waiting for send responses: the
+            # echoes read by verifier() confirm delivery.
+            reports = await asyncio.gather(*(send_one(msg) for msg in msgs))
+            print("\n".join(reports))  # One print, not one per send
+
+        async def verifier():
+            airecv = e.airecv
+            results = []
+            for msg in msgs:
+                mac, reply = await airecv()
+                results.append(reply == msg)
+            return results
+
+        # Read the echoes while the burst is still being sent. Results are
+        # printed afterwards so the output order does not depend on timing.
+        _, results = await asyncio.gather(sender(), verifier())
+        for ok in results:
+            print("OK" if ok else "ERROR: Received != Sent")
 
         # Tell the server to stop
         print("DONE")
         msg = b"!done"
-        client_send(e, peer, msg, True)
+        print(client_send(e, peer, msg, True))
         mac, reply = await e.airecv()
         print("OK" if reply == msg else "ERROR: Received != Sent")
 
@@ -120,6 +137,3 @@ try:
     def instance1():
         # Instance 1 (the client)
         asyncio.run(client())
-
-except:
-    pass